@@ -28,6 +28,7 @@ class Controller:
 
     def onclick_user_mode_btn(self, _):
         """User mode button was clicked"""
+        self.view.flush()
         
         if self.model.is_user_an_admin:
             self.model.application_mode = ApplicationMode.ADMIN
@@ -39,6 +40,7 @@ class Controller:
 
     def onclick_admin_mode_btn(self, _):
         """Admin mode button was clicked"""
+        self.view.flush()
         self.model.application_mode = ApplicationMode.USER
         self.view.modify_cursor_style(CSS.CURSOR_MOD__WAIT)
         self.view.update_base_app()
@@ -82,6 +84,7 @@ class Controller:
 
     def onclick_next_from_upage_1(self, _):
         """'Next' button on the file upload page was clicked"""
+        self.view.flush()
         
         if len(self.model.uploadedfile_name) == 0:
             self.view.show_notification(Notification.INFO, Notification.PLEASE_UPLOAD)
@@ -116,8 +119,7 @@ class Controller:
         if not change["new"] == self.model.model_name:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.model_name = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_header_is_included_checkbox(self, change):
@@ -126,8 +128,7 @@ class Controller:
         if not change["new"] == self.model.header_is_included:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.header_is_included = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_lines_to_skip_text(self, change):
@@ -151,8 +152,7 @@ class Controller:
             self.view.show_notification(Notification.WARNING, "Invalid number of lines")
             self.model.lines_to_skip = 0
 
-        self.view.update_data_specification_page()
-        self.view.modify_cursor_style(None)
+        self.view.request_data_specification_page_update()
         self._reset_later_pages()
 
     def onchange_delimiter_dropdown(self, change):
@@ -161,8 +161,7 @@ class Controller:
         if not Delimiter.get_model(change["new"]) == self.model.delimiter:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.delimiter = Delimiter.get_model(change["new"])
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_scenarios_to_ignore_text(self, change):
@@ -170,7 +169,7 @@ class Controller:
         # Event triggered programmatically by page update, not by user actions
         if not change["new"] == self.model.scenarios_to_ignore_str:
             self.model.scenarios_to_ignore_str = change["new"]
-            self.view.update_data_specification_page()
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_scenario_column_dropdown(self, change):
@@ -179,8 +178,7 @@ class Controller:
         if not change["new"] == self.model.assigned_scenario_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_scenario_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_region_column_dropdown(self, change):
@@ -189,8 +187,7 @@ class Controller:
         if not change["new"] == self.model.assigned_region_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_region_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_variable_column_dropdown(self, change):
@@ -199,8 +196,7 @@ class Controller:
         if not change["new"] == self.model.assigned_variable_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_variable_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_item_column_dropdown(self, change):
@@ -208,8 +204,7 @@ class Controller:
         if not change["new"] == self.model.assigned_item_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_item_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_unit_column_dropdown(self, change):
@@ -217,8 +212,7 @@ class Controller:
         if not change["new"] == self.model.assigned_unit_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_unit_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_year_column_dropdown(self, change):
@@ -226,8 +220,7 @@ class Controller:
         if not change["new"] == self.model.assigned_year_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_year_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onchange_value_column_dropdown(self, change):
@@ -235,17 +228,18 @@ class Controller:
         if not change["new"] == self.model.assigned_value_column:
             self.view.modify_cursor_style(CSS.CURSOR_MOD__PROGRESS)
             self.model.assigned_value_column = change["new"]
-            self.view.update_data_specification_page()
-            self.view.modify_cursor_style(None)
+            self.view.request_data_specification_page_update()
             self._reset_later_pages()
 
     def onclick_previous_from_upage_2(self, _):
         """'Previous' button on the data specification page was clicked"""
+        self.view.flush()
         self.model.current_user_page = UserPage.FILE_UPLOAD
         self.view.update_base_app()
 
     def onclick_next_from_upage_2(self, _):
         """'Next' button on the data specification page was clicked"""
+        self.view.flush()
         warning_message = self.model.validate_data_specification_input()
 
         if warning_message is not None:
@@ -384,6 +378,7 @@ class Controller:
 
     def onclick_restart_submission(self, _):
         """The restart submission icon button was clicked"""
+        self.view.flush()
         self.model.current_user_page = UserPage.FILE_UPLOAD
         self.model.furthest_active_user_page = UserPage.FILE_UPLOAD
         self.view.modify_cursor_style(CSS.CURSOR_MOD__WAIT)
@@ -112,6 +112,7 @@ class CSS:
     NOTIFICATION__SUCCESS = "rc-notification--success"
     NOTIFICATION__WARNING = "rc-notification--warning"
     PREVIEW_TABLE = "rc-preview-table"
+    ROWS_OVERVIEW_DOWNLOAD_BUTTONS = "rc-rows-overview-download-buttons"
     ROWS_OVERVIEW_TABLE = "rc-rows-overview-table"
     STEPPER_EL = "rc-stepper-element"
     STEPPER_EL__ACTIVE = "rc-stepper-element--active"
@@ -120,12 +121,14 @@ class CSS:
     STEPPER_EL__NUMBER = "rc-stepper-element__number"
     STEPPER_EL__SEPARATOR = "rc-stepper-element__separator"
     STEPPER_EL__TITLE = "rc-stepper-element__title"
+    TABLE_CELL = "rc-table-cell"
     UA = "rc-upload-area"
     UA__BACKGROUND = "rc-upload-area__background"
     UA__FILE_UPLOADER = "rc-upload-area__file-uploader"
     UA__OVERLAY = "rc-upload-area__overlay"
     UA__FILE_LABEL = "rc-upload-area__file-label"
     UNKNOWN_LABELS_TABLE = "rc-unknown-labels-table"
+    UNKNOWN_LABELS_TABLE__ROW = "rc-unknown-labels-table__row"
     VISUALIZATION_TAB = "rc-visualization-tab"
     VISUALIZATION_TAB__ELEMENT = "rc-visualization-tab__element"
     VISUALIZATION_TAB__ELEMENT__ACTIVE = "rc-visualization-tab__element--active"
@@ -1,21 +1,165 @@
+import json
 import numpy as np
 import ipywidgets as ui
+from html import escape
 from IPython.core.display import Javascript, clear_output, display, HTML
-from pandas.core.frame import DataFrame
 from matplotlib import pyplot as plt
-from threading import Timer
+from matplotlib.figure import Figure
+from threading import Condition, Lock, Thread, Timer, current_thread
+from time import monotonic
+from functools import lru_cache, partial, wraps
 from .utils import *
 
 
 PLOT_HEIGHT = 11
 PLOT_WIDTH = 5.5
+PAGE_UPDATE_DELAY = 0.3  # seconds w/o new update requests before a debounced page update runs
+NOTIFICATION_DURATION = 3.5  # seconds a notification stays visible
+PAGE_TITLES = ("File Upload", "Data Specification", "Integrity Checking", "Plausibility Checking")
+NUM_OF_PAGES = len(PAGE_TITLES)
+EMPTY_TABLE_ROW = "<tr><td>-</td><td>-</td><td>-</td></tr>"  # placeholder row for 3-column HTML tables
+SUBMISSIONS_TABLE_MIN_ROWS = 15  # submissions table is padded w/placeholder rows up to this many rows
+# Placeholder rows to pad submissions table w/, indexed by number of missing rows
+SUBMISSIONS_TABLE_PADDING = tuple(EMPTY_TABLE_ROW * num_rows for num_rows in range(SUBMISSIONS_TABLE_MIN_ROWS + 1))
+# Javascript to show a modal dialog, title & body are filled in as JS string literals
+MODAL_DIALOG_JS = """
+    require(
+        ["base/js/dialog"],
+        function(dialog) {{
+            dialog.modal({{
+                title: {title},
+                body: {body},
+                sanitize: false,
+                buttons: {{
+                    'Close': {{}}
+                }}
+        }});
+    }})
+    """
+# Icon, notification DOM class & text color DOM class of ea notification variant
+NOTIFICATION_VARIANT_STYLES = {
+    Notification.SUCCESS: (Notification.SUCCESS_ICON, CSS.NOTIFICATION__SUCCESS, CSS.COLOR_MOD__WHITE),
+    Notification.INFO: (Notification.INFO_ICON, CSS.NOTIFICATION__INFO, CSS.COLOR_MOD__WHITE),
+    Notification.WARNING: (Notification.WARNING_ICON, CSS.NOTIFICATION__WARNING, CSS.COLOR_MOD__BLACK),
+    Notification.ERROR: (Notification.ERROR_ICON, CSS.NOTIFICATION__ERROR, CSS.COLOR_MOD__WHITE),
+}
+DELIMITER_OPTIONS = ("", *sorted(Delimiter.get_views()))  # delimiter views never change, so sorted only once
+# Layouts shared by widgets across user pages & admin page (a layout is a widget, sharing avoids one per user)
+USER_PAGE_LAYOUT = ui.Layout(flex="1", width="100%", align_items="center", justify_content="center")
+NAVIGATION_BOX_LAYOUT = ui.Layout(justify_content="flex-end", width="100%")
+NEXT_BUTTON_LAYOUT = ui.Layout(align_self="flex-end", justify_self="flex-end")
+PREVIOUS_BUTTON_LAYOUT = ui.Layout(align_self="flex-end", justify_self="flex-end", margin="0px 8px")
+# Layouts shared by the value trends & growth trends tabs
+TRENDS_TAB_CONTENT_LAYOUT = ui.Layout(align_items="center", padding="24px 0px 0px 0px", overflow_y="hidden")
+TRENDS_TAB_GRID_LAYOUT = ui.Layout(
+    grid_template_columns="1fr 2fr 1fr 2fr 1fr 2fr", grid_gap="16px 16px", overflow_y="hidden"
+)
+TRENDS_TAB_DDOWN_LAYOUT = ui.Layout(width="200px")
+TRENDS_TAB_VISUALIZE_BUTTON_LAYOUT = ui.Layout(margin="24px 0px 0px 0px")
+TRENDS_TAB_VIZ_OUTPUT_LAYOUT = ui.Layout(
+    margin="24px 0px 0px",
+    justify_content="center",
+    align_items="center",
+    height="360px",
+    width="100%",
+    overflow="auto",
+)
+# Bad labels overview table, initially w/placeholder rows
+BAD_LABELS_TABLE_HTML = """
+    <table>
+        <thead>
+            <th>Label</th>
+            <th>Associated column</th>
+            <th>Fix</th>
+        </thead>
+        <tbody>
+            {table_rows}
+        </tbody>
+    </table>
+"""
+BAD_LABELS_TABLE_INITIAL_HTML = BAD_LABELS_TABLE_HTML.format(table_rows=EMPTY_TABLE_ROW * 3)
+# Icon button to download a file, href & download attributes are filled in per file
+DOWNLOAD_BUTTON_HTML = """
+    <a
+        href="{href}"
+        download="{download}"
+        class="{css_class}"
+        style="line-height:36px;"
+        title=""
+    >
+        <i class="fa fa-download" style="margin-left: 4px;"></i>
+    </a>
+"""
+# Initial DOM classes of ea stepper element, only the first page is current when app is built
+STEPPER_EL_CLASSES = tuple(
+    (CSS.STEPPER_EL, CSS.STEPPER_EL__CURRENT if page_index == 0 else CSS.STEPPER_EL__INACTIVE)
+    for page_index in range(NUM_OF_PAGES)
+)
+
+
+@lru_cache(maxsize=64)
+def get_line_color_cycler(num_lines):
+    """Return cycler w/enough distinct colors for all lines of a multi-line chart."""
+    # https://stackoverflow.com/a/35971096/16133077
+    return plt.cycler("color", plt.cm.jet(np.linspace(0, 1, num_lines)))  # type: ignore
+
+
+@lru_cache(maxsize=16)
+def get_download_button_html(path):
+    """Return HTML of icon button to download file at path, cached since download paths are constant."""
+    return DOWNLOAD_BUTTON_HTML.format(href=str(path), download=path.name, css_class=CSS.ICON_BUTTON)
+
+
+def get_table_cell(text):
+    """Return cell for static grid tables, HTML styled like a Label (see TABLE_CELL in style.html) w/o a Box wrapper."""
+    return CSS.assign_class(ui.HTML(value=text), CSS.TABLE_CELL)
+
+
+@lru_cache(maxsize=1024)
+def get_hoverable_html(value):
+    """Return HTML showing value w/value as tooltip, cached since same labels repeat across table rows."""
+    value = escape(str(value))
+    return f'<span title="{value}">{value}</span>'
+
+
+def debounce_page_update(update_method):
+    """Delay page update until update requests stop coming in, burst of requests repaints the page only once.
+
+    Only for onchange callbacks, navigation & other controller-initiated updates call page update methods directly.
+    """
+
+    @wraps(update_method)
+    def debounced_update_method(self):
+        self._schedule_page_update(update_method)
+
+    return debounced_update_method
+
+
+def get_preview_table_html(table_content):
+    """Return HTML table showing ea cell of 2D ndarray."""
+    table_rows = "".join(
+        "<tr>" + "".join(f"<td>{escape(str(cell))}</td>" for cell in row) + "</tr>" for row in table_content
+    )
+    return f"<table>{table_rows}</table>"
+
+
+def set_dropdown_options(widget: ui.Dropdown, options, onchange_callback, value=None):
+    """Reassign options & value w/o onchange callback reacting to it, options must be a sorted tuple.
+
+    Callers sort options once, options shared by several dropdowns aren't re-sorted for ea dropdown.
+    """
+    if widget.options == options:
+        # Only value needs to be synced, callback stays observed so a concurrent user selection isn't dropped
+        # (value is the model's value, which onchange callbacks treat as no change)
+        widget.value = value
+        return
 
-
-def set_dropdown_options(widget: ui.Dropdown, options, onchange_callback):
-    """Reassign options w/o triggering onchange callback, options will be sorted first."""
     widget.unobserve(onchange_callback, "value")
-    widget.options = sorted(options)
-    widget.value = None
+
+    with widget.hold_sync():  # Send options & value to frontend in one message
+        widget.options = options
+        widget.value = value
+
     widget.observe(onchange_callback, "value")
 
 
@@ -32,9 +176,20 @@ class View:
         self.model = Model()
         self.ctrl = Controller()
 
-        self._notification_timer = Timer(0.0, None)
-        self._input_data_table_childrenpool = []
-        self._unknown_labels_tbl_cell_pool = []
+        # Notification is hidden by one long-lived worker thread once its deadline (monotonic clock) has passed
+        self._notification_deadline = None
+        self._notification_condition = Condition()
+        self._notification_worker = None
+        self._page_update_timers = {}  # - pending debounced page updates, keyed by update method name
+        self._page_update_lock = Lock()  # - guards timers, shared by kernel thread & timer threads
+        self._page_update_running_lock = Lock()  # - held while a debounced page update runs or is flushed
+        self._cursor_style_lock = Lock()  # - cursor style is also reset from debounced page updates' timer threads
+        self._user_pages = [None] * NUM_OF_PAGES  # - user pages are built on first use, see _get_user_page
+        self._user_pages_lock = Lock()  # - debounced page updates may request a page from a timer thread
+        self._unknown_labels_tbl_row_pool = []
+        self._unknown_labels_tbl_rows = []
+        self._last_submitted_files_info = None  # - table content last rendered, to skip redundant rebuilds
+        self._last_bad_labels_overview_tbl = None
 
     def intro(self, model, ctrl):  # type: ignore # noqa
         """Introduce MVC modules to each other."""
@@ -57,16 +212,23 @@ class View:
         """Change cursor style."""
         cursor_mod_classes = CSS.get_cursor_mod_classes()
 
-        for cursor_mod_class in cursor_mod_classes:  # Remove all other cursor mods from DOM
-            self.app_container.remove_class(cursor_mod_class)
-        
-        if new_cursor_mod_class is not None:
-            self.app_container.add_class(new_cursor_mod_class)
+        with self._cursor_style_lock, self.app_container.hold_sync():  # Send resulting DOM classes in one message
+            for cursor_mod_class in cursor_mod_classes:  # Remove all other cursor mods from DOM
+                self.app_container.remove_class(cursor_mod_class)
+            
+            if new_cursor_mod_class is not None:
+                self.app_container.add_class(new_cursor_mod_class)
 
     def show_notification(self, variant, content):
         """Display notification to user."""
-        # Cancel existing timer if still running
-        self._notification_timer.cancel()
+        # Get variant's style before touching any widget, so an unknown variant leaves notification as is
+        if variant not in NOTIFICATION_VARIANT_STYLES:
+            raise Exception(f"Notification variant does not exist: {variant}")
+        icon, variant_class, text_color_class = NOTIFICATION_VARIANT_STYLES[variant]
+
+        # Cancel existing deadline if still pending
+        with self._notification_condition:
+            self._notification_deadline = None
         
         # Reset notification's DOM classes
         # Clickaway listener in JS which removes DOM class from notification's view w/o tellling notification's model. 
@@ -78,115 +240,160 @@ class View:
         notification_text.value = content
 
         # Update notification visibility & style
-        if variant == Notification.SUCCESS:
-            self.notification.children = (Notification.SUCCESS_ICON, notification_text)
-            self.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__SUCCESS)
-            notification_text._dom_classes = (CSS.COLOR_MOD__WHITE,)
-        elif variant == Notification.INFO:
-            self.notification.children = (Notification.INFO_ICON, notification_text)
-            self.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__INFO)
-            notification_text._dom_classes = (CSS.COLOR_MOD__WHITE,)
-        elif variant == Notification.WARNING:
-            self.notification.children = (Notification.WARNING_ICON, notification_text)
-            self.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__WARNING)
-            notification_text._dom_classes = (CSS.COLOR_MOD__BLACK,)
-        elif variant == Notification.ERROR:
-            self.notification.children = (Notification.ERROR_ICON, notification_text)
-            self.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__ERROR)
-            notification_text._dom_classes = (CSS.COLOR_MOD__WHITE,)
-        else:
-            print("Variant does not exists")
-        
-        # Create timer to hide notification after X seconds
-        self._notification_timer = Timer(3.5, self.notification.remove_class, args=[CSS.NOTIFICATION__SHOW])
-        self._notification_timer.start()
+        self.notification.children = (icon, notification_text)
+        self.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, variant_class)
+        notification_text._dom_classes = (text_color_class,)
+
+        # Hide notification after X seconds
+        with self._notification_condition:
+            self._notification_deadline = monotonic() + NOTIFICATION_DURATION
+            if self._notification_worker is None:
+                self._notification_worker = Thread(target=self._hide_expired_notifications, daemon=True)
+                self._notification_worker.start()
+            self._notification_condition.notify()
+
+    def _hide_expired_notifications(self):
+        """Worker loop, sleep until the current notification deadline then hide the notification."""
+        with self._notification_condition:
+            while True:
+                if self._notification_deadline is None:
+                    self._notification_condition.wait()
+                    continue
+                remaining = self._notification_deadline - monotonic()
+                if remaining > 0:  # Deadline may be moved by a newer notification while waiting
+                    self._notification_condition.wait(remaining)
+                    continue
+                self._notification_deadline = None
+                self.notification.remove_class(CSS.NOTIFICATION__SHOW)
 
     def show_modal_dialog(self, title, body):
-        # NOTE: Current method to display modal dialog requires title/body arg to not have newline
-        data = """
-            require(
-                ["base/js/dialog"],
-                function(dialog) {
-                    dialog.modal({
-                        title: '%s',
-                        body: '%s',
-                        sanitize: false,
-                        buttons: {
-                            'Close': {}
-                        }
-                });
-            })
-            """ % (
-            title,
-            body,
-        )
+        # JSON-encode title & body so quotes & newlines can't break the Javascript
+        # Body is also HTML-escaped since dialog inserts it as HTML (title is inserted as text)
+        data = MODAL_DIALOG_JS.format(title=json.dumps(title), body=json.dumps(escape(body)))
         display(Javascript(data=data, css="modal.css"))
 
+    def flush(self):
+        """Run pending debounced page updates & wait for a running one, so they can't overlap what comes next.
+
+        Controller calls this before navigating or resetting pages.
+        """
+        with self._page_update_running_lock:  # - a timer thread may be in the middle of an update
+            with self._page_update_lock:
+                timers = tuple(self._page_update_timers.values())
+                self._page_update_timers.clear()
+
+            for timer in timers:
+                timer.cancel()
+                timer.args[0](self)
+
+    def _schedule_page_update(self, update_method):
+        """(Re)start the timer of a debounced page update."""
+        with self._page_update_lock:
+            pending_timer = self._page_update_timers.get(update_method.__name__)
+
+            if pending_timer is not None:
+                pending_timer.cancel()
+            timer = Timer(PAGE_UPDATE_DELAY, self._on_page_update_timer, args=(update_method,))
+            self._page_update_timers[update_method.__name__] = timer
+            timer.start()
+
+    def _on_page_update_timer(self, update_method):
+        with self._page_update_running_lock:
+            with self._page_update_lock:
+                # Skip if timer was replaced or flushed after it fired
+                if self._page_update_timers.get(update_method.__name__) is not current_thread():
+                    return
+                del self._page_update_timers[update_method.__name__]
+
+            try:
+                update_method(self)
+            except Exception as error:  # Nobody can catch errors raised in a timer thread, so show them to the user
+                self.show_notification(Notification.ERROR, str(error))
+
+    def _get_user_page(self, page_index):
+        """Return user page, build it & add it (hidden) to page container on first use."""
+        with self._user_pages_lock:
+            if self._user_pages[page_index] is None:
+                build_page = (
+                    self._build_file_upload_page,
+                    self._build_data_specification_page,
+                    self._build_integrity_checking_page,
+                    self._build_plausibility_checking_page,
+                )[page_index]
+                page = build_page()
+                page.add_class(CSS.DISPLAY_MOD__NONE)
+                self._user_pages[page_index] = page
+                self.user_page_container.children = (*self.user_page_container.children, page)
+
+            return self._user_pages[page_index]
+
     def update_base_app(self):
         # Create helper variables
-        NUM_OF_PAGES = len(self.user_page_container.children)
         current_page_index = self.model.current_user_page - 1
 
         # Update visibility of pages & style of page stepper elements
         for page_index in range(0, NUM_OF_PAGES):
-            # Get page and stepper element
-            page = self.user_page_container.children[page_index]
+            # Get stepper element
             stepper_element = self.user_page_stepper.children[page_index]
 
             if page_index == current_page_index:
-                # Show page & style stepper element apropriately
-                page.remove_class(CSS.DISPLAY_MOD__NONE)
-                stepper_element._dom_classes = (CSS.STEPPER_EL, CSS.STEPPER_EL__CURRENT)
+                # Show page (build it if not built yet) & style stepper element apropriately
+                self._get_user_page(page_index).remove_class(CSS.DISPLAY_MOD__NONE)
+                stepper_element_classes = (CSS.STEPPER_EL, CSS.STEPPER_EL__CURRENT)
             else:
-                # Hide page & style stepper element appropriately
-                page.add_class(CSS.DISPLAY_MOD__NONE)
-                stepper_element._dom_classes = (
+                # Hide page (unbuilt pages aren't in DOM) & style stepper element appropriately
+                if self._user_pages[page_index] is not None:
+                    self._user_pages[page_index].add_class(CSS.DISPLAY_MOD__NONE)
+                stepper_element_classes = (
                     (CSS.STEPPER_EL, CSS.STEPPER_EL__ACTIVE)
                     if page_index < self.model.furthest_active_user_page
                     else (CSS.STEPPER_EL, CSS.STEPPER_EL__INACTIVE)
                 )
+
+            if stepper_element._dom_classes != stepper_element_classes:  # Only restyle elements whose state changed
+                stepper_element._dom_classes = stepper_element_classes
         # Update application mode
         if self.model.application_mode == ApplicationMode.USER:
-            self.app_header.children = [self.app_title, self.user_mode_btn]
+            self.app_header.children = (self.app_title, self.user_mode_btn)
             self.user_page_container.remove_class(CSS.DISPLAY_MOD__NONE)
             self.user_page_stepper.remove_class(CSS.DISPLAY_MOD__NONE)
-            self.app_body.children = [self.user_page_stepper, self.user_page_container]
+            self.app_body.children = (self.user_page_stepper, self.user_page_container)
 
         if self.model.application_mode == ApplicationMode.ADMIN:
-            self.app_header.children = [self.app_title, self.admin_mode_btn]
+            self.app_header.children = (self.app_title, self.admin_mode_btn)
             self.user_page_container.add_class(CSS.DISPLAY_MOD__NONE)
             self.user_page_stepper.add_class(CSS.DISPLAY_MOD__NONE)
-            table_rows = ""
-            cur_len = 0
-
-            for row in self.model.get_submitted_files_info():
-                table_rows += "<tr>"
-
-                for colidx in range(len(row)):
-                    field = row[colidx]
-                    table_rows += f"<td>{field}</td>"
-                table_rows += "</tr>"
-                cur_len += 1
-
-            for _ in range(cur_len, 15):
-                table_rows += "<tr><td>-</td><td>-</td><td>-</td></tr>"
-
-            self.submissions_tbl.value = f"""
-                <table class="table">
-                    <thead>
-                        <th style="width: 350px;">File</th>
-                        <th style="width: 200px;">Associated Project</th>
-                        <th style="width: 150px;">Status</th>
-                    </thead>
-                    <tbody>
-                        {table_rows}
-                    </tbody>
-                </table>
-            """
+
+            if self.admin_page is None:
+                self.admin_page = self._build_admin_page()
+
+            submitted_files_info = tuple(map(tuple, self.model.get_submitted_files_info()))
+
+            # Skip rebuilding table when submissions haven't changed since last time
+            if submitted_files_info != self._last_submitted_files_info:
+                self._last_submitted_files_info = submitted_files_info
+                # Single pass over submissions (all fields are str), table is padded w/placeholder rows
+                table_rows = "".join("<tr><td>" + "</td><td>".join(row) + "</td></tr>" for row in submitted_files_info)
+                num_missing_rows = max(0, SUBMISSIONS_TABLE_MIN_ROWS - len(submitted_files_info))
+                placeholder_rows = SUBMISSIONS_TABLE_PADDING[num_missing_rows]
+
+                self.submissions_tbl.value = f"""
+                    <table class="table">
+                        <thead>
+                            <th style="width: 350px;">File</th>
+                            <th style="width: 200px;">Associated Project</th>
+                            <th style="width: 150px;">Status</th>
+                        </thead>
+                        <tbody>
+                            {table_rows}
+                            {placeholder_rows}
+                        </tbody>
+                    </table>
+                """
 
             # NOTE: DO NOT remove user pages from DOM tree even when going into admin mode. 
             #       Would break event handler registration done in JS context (e.g. for file upload) 
-            self.app_body.children = [self.user_page_stepper, self.user_page_container, self.admin_page]
+            self.app_body.children = (self.user_page_stepper, self.user_page_container, self.admin_page)
 
     def update_file_upload_page(self):
         # Update file name snackbar
@@ -209,154 +416,143 @@ class View:
         # Reset hidden filename value
         self.ua_file_label.value = ""
 
+    @debounce_page_update
+    def request_data_specification_page_update(self):
+        """Update data specification page once onchange callbacks stop coming in, then reset cursor style."""
+        try:
+            self.update_data_specification_page()
+        finally:
+            self.modify_cursor_style(None)
+
     def update_data_specification_page(self):
         self.DATA_SPEC_PAGE_IS_BEING_UPDATED = True
-        
+
+        try:
+            self._update_data_specification_page()
+        finally:
+            self.DATA_SPEC_PAGE_IS_BEING_UPDATED = False
+
+    def _update_data_specification_page(self):
+        self._get_user_page(UserPage.DATA_SPECIFICATION - 1)
         # Update input format specification widgets
         set_dropdown_options(
-            self.model_name_ddown, ("", *self.model.VALID_MODEL_NAMES), self.ctrl.onchange_model_name_dropdown
+            self.model_name_ddown,
+            ("", *sorted(self.model.VALID_MODEL_NAMES)),
+            self.ctrl.onchange_model_name_dropdown,
+            self.model.model_name,
+        )
+        set_dropdown_options(
+            self.delimiter_ddown,
+            DELIMITER_OPTIONS,
+            self.ctrl.onchange_delimiter_dropdown,
+            Delimiter.get_view(self.model.delimiter),
         )
-        self.model_name_ddown.value = self.model.model_name
-        set_dropdown_options(self.delimiter_ddown, ("", *Delimiter.get_views()), self.ctrl.onchange_delimiter_dropdown)
-        self.delimiter_ddown.value = Delimiter.get_view(self.model.delimiter)
         self.header_is_included_chkbox.value = self.model.header_is_included
         self.lines_to_skip_txt.value = str(self.model.lines_to_skip)
         self.scenarios_to_ignore_txt.value = self.model.scenarios_to_ignore_str
         
         # Update column assignment widgets
-        column_options = ("", *self.model.column_assignment_options)
+        column_options = ("", *sorted(self.model.column_assignment_options))  # - shared by all 7 dropdowns
         self.model_name_lbl.value = self.model.model_name if len(self.model.model_name) > 0 else "<Model Name>"
-        set_dropdown_options(self.scenario_column_ddown, column_options, self.ctrl.onchange_scenario_column_dropdown)
-        self.scenario_column_ddown.value = self.model.assigned_scenario_column
-        set_dropdown_options(self.region_column_ddown, column_options, self.ctrl.onchange_region_column_dropdown)
-        self.region_column_ddown.value = self.model.assigned_region_column
-        set_dropdown_options(self.variable_column_ddown, column_options, self.ctrl.onchange_variable_column_dropdown)
-        self.variable_column_ddown.value = self.model.assigned_variable_column
-        set_dropdown_options(self.item_column_ddown, column_options, self.ctrl.onchange_item_column_dropdown)
-        self.item_column_ddown.value = self.model.assigned_item_column
-        set_dropdown_options(self.unit_column_ddown, column_options, self.ctrl.onchange_unit_column_dropdown)
-        self.unit_column_ddown.value = self.model.assigned_unit_column
-        set_dropdown_options(self.year_column_ddown, column_options, self.ctrl.onchange_year_column_dropdown)
-        self.year_column_ddown.value = self.model.assigned_year_column
-        set_dropdown_options(self.value_column_ddown, column_options, self.ctrl.onchange_value_column_dropdown)
-        self.value_column_ddown.value = self.model.assigned_value_column
-        
-        # Upload input data preview table
-        # TODO: implement this table with ipywidgets HTML
-        table_content = self.model.input_data_preview_content
-        number_of_columns = table_content.shape[1]
-        table_content = table_content.flatten()
-
-        # - increase pool size if it's insufficient
-        if len(table_content) > len(self._input_data_table_childrenpool):
-            pool_addition = [ui.Box(children=[ui.Label(value="")]) for _ in range(len(table_content))]
-            self._input_data_table_childrenpool += pool_addition
-
-        content_index = 0
-
-        for content in table_content:
-            content_box = self._input_data_table_childrenpool[content_index]
-            content_label = content_box.children[0]
-            content_label.value = content
-            content_index += 1
-
-        self.input_data_preview_tbl.children = self._input_data_table_childrenpool[: table_content.size]
-        self.input_data_preview_tbl.layout.grid_template_columns = f"repeat({number_of_columns}, 1fr)"
+        set_dropdown_options(
+            self.scenario_column_ddown,
+            column_options,
+            self.ctrl.onchange_scenario_column_dropdown,
+            self.model.assigned_scenario_column,
+        )
+        set_dropdown_options(
+            self.region_column_ddown,
+            column_options,
+            self.ctrl.onchange_region_column_dropdown,
+            self.model.assigned_region_column,
+        )
+        set_dropdown_options(
+            self.variable_column_ddown,
+            column_options,
+            self.ctrl.onchange_variable_column_dropdown,
+            self.model.assigned_variable_column,
+        )
+        set_dropdown_options(
+            self.item_column_ddown,
+            column_options,
+            self.ctrl.onchange_item_column_dropdown,
+            self.model.assigned_item_column,
+        )
+        set_dropdown_options(
+            self.unit_column_ddown,
+            column_options,
+            self.ctrl.onchange_unit_column_dropdown,
+            self.model.assigned_unit_column,
+        )
+        set_dropdown_options(
+            self.year_column_ddown,
+            column_options,
+            self.ctrl.onchange_year_column_dropdown,
+            self.model.assigned_year_column,
+        )
+        set_dropdown_options(
+            self.value_column_ddown,
+            column_options,
+            self.ctrl.onchange_value_column_dropdown,
+            self.model.assigned_value_column,
+        )
         
-        # Update output data preview table
-        # TODO: implement table with ipywidgets HTML instead of GridBox
-        table_content = self.model.output_data_preview_content
-        table_content = table_content.flatten()
-        content_index = 0
-
-        for content in table_content:
-            content_box = self.output_data_preview_tbl.children[content_index]
-            content_label = content_box.children[0]
-            content_label.value = table_content[content_index]
-            content_index += 1
-
-        self.DATA_SPEC_PAGE_IS_BEING_UPDATED = False
+        # Update input & output data preview tables
+        self.input_data_preview_tbl.value = get_preview_table_html(self.model.input_data_preview_content)
+        self.output_data_preview_tbl.value = get_preview_table_html(self.model.output_data_preview_content)
 
     def update_integrity_checking_page(self):
+        self._get_user_page(UserPage.INTEGRITY_CHECKING - 1)
         # Update row summary labels
         self.rows_w_struct_issues_lbl.value = "{:,}".format(self.model.nrows_w_struct_issue)
         self.rows_w_ignored_scenario_lbl.value = "{:,}".format(self.model.nrows_w_ignored_scenario)
         self.duplicate_rows_lbl.value = "{:,}".format(self.model.nrows_duplicates)
         self.accepted_rows_lbl.value = "{:,}".format(self.model.nrows_accepted)
 
-        # Update bad labels overview table
+        # Update bad labels overview table (skip if table content is unchanged)
+        bad_labels_overview_tbl = tuple(map(tuple, self.model.bad_labels_overview_tbl))
 
-        _table_rows = ""
+        if bad_labels_overview_tbl != self._last_bad_labels_overview_tbl:
+            self._last_bad_labels_overview_tbl = bad_labels_overview_tbl
+            _table_rows = []
 
-        for row in self.model.bad_labels_overview_tbl:
-            _table_rows += "<tr>"
-
-            for colidx in range(len(row)):
-                field = row[colidx]
-
-                if colidx == 1:  # If middle field / "Associated column" field
-                    _table_rows += f"<td>{field}</td>"
-                else:
-                    _table_rows += f'<td title="{field}">{field}</td>'
+            for label, associated_column, fix in bad_labels_overview_tbl:
+                # Fields come from uploaded file, escape them so quotes & brackets can't break table markup
+                label, associated_column, fix = escape(str(label)), escape(str(associated_column)), escape(str(fix))
+                # Only the label & fix fields get a hover title, "Associated column" field is short
+                _table_rows.append(
+                    f'<tr><td title="{label}">{label}</td><td>{associated_column}</td><td title="{fix}">{fix}</td></tr>'
+                )
 
-            _table_rows += "</tr>"
+            _table_rows = "".join(_table_rows)
 
-        self.bad_labels_tbl.value = f"""
-            <table>
-                <thead>
-                    <th>Label</th>
-                    <th>Associated column</th>
-                    <th>Fix</th>
-                </thead>
-                <tbody>
-                    {_table_rows}
-                </tbody>
-            </table>
-            """
+            self.bad_labels_tbl.value = BAD_LABELS_TABLE_HTML.format(table_rows=_table_rows)
         self._update_unknown_labels_overview_table()
 
     def _update_unknown_labels_overview_table(self):
         # NOTE: Refer to docs on init of this table 
         # Calculate helper variables
-        NCOLS = 5
         nrowsneeded = len(self.model.unknown_labels_overview_tbl)
-        nrowssupported = int(  # We deduct NCOLS from calc to exclude header row
-            (len(self._unknown_labels_tbl_cell_pool) - NCOLS) / NCOLS
-        )
 
-        # Enlarge children pool if needed
-        if nrowsneeded > nrowssupported:
+        # Enlarge row pool if needed
+        self._grow_unknown_labels_tbl_row_pool(nrowsneeded)
 
-            # Create enough child cells to form missing rows, ea. row: [label, label, label, dropdown, checkbox]
-            for row_index in range(nrowssupported, nrowsneeded):
-                # create lambda that returns onchange callback assigned to ipywidgets dropdown
-                _get_dropdown_callback = lambda row_index: lambda change: self.ctrl.onchange_fix_dropdown(
-                    change, row_index
-                )
-                # create lambda returns onchange callback assigned to ipywidgets checkbox
-                _get_checkbox_callback = lambda row_index: lambda change: self.ctrl.onchange_override_checkbox(
-                    change, row_index
-                )
-                dropdown = ui.Dropdown()
-                dropdown.observe(_get_dropdown_callback(row_index), "value")
-                checkbox = ui.Checkbox(indent=False, value=False, description="")
-                checkbox.observe(_get_checkbox_callback(row_index), "value")
-                self._unknown_labels_tbl_cell_pool += [
-                    ui.Box(children=[ui.HTML(value="-")]),
-                    ui.Box(children=[ui.HTML(value="-")]),
-                    ui.Box(children=[ui.HTML(value="-")]),
-                    ui.Box(children=[dropdown]),
-                    ui.Box(children=[checkbox]),
-                ]
+        # Get fix dropdown options for ea associated column once, instead of per row
+        fix_options = {
+            "-": ("",),
+            "Scenario": ("", *self.model.VALID_SCENARIOS),
+            "Region": ("", *self.model.VALID_REGIONS),
+            "Variable": ("", *self.model.VALID_VARIABLES),
+            "Item": ("", *self.model.VALID_ITEMS),
+            "Unit": ("", *self.model.VALID_UNITS),
+        }
 
         # Update values displayed at ea row
         for row_index in range(nrowsneeded):
 
             # Get cell widgets for row
-            cellpoolstartindex = (row_index * NCOLS) + NCOLS  #  we add NCOLS to account for header row
-            unknownlabel_w, associatedcolumn_w, closestmatch_w, fix_w, override_w = [
-                cell_wrapper.children[0]
-                for cell_wrapper in self._unknown_labels_tbl_cell_pool[cellpoolstartindex : cellpoolstartindex + 5]
+            unknownlabel_w, associatedcolumn_w, closestmatch_w, fix_w, override_w = self._unknown_labels_tbl_rows[
+                row_index
             ]
             
             # Get cell values for row from model
@@ -364,34 +560,45 @@ class View:
             unknownlabel, associatedcolumn, closestmatch, fix, override = row
             
             # Update cell widgets based on retrieved values from model
-            get_hoverable_html = lambda value: f"<span title={value}>{value}</span>"
             unknownlabel_w.value = get_hoverable_html(unknownlabel)
             associatedcolumn_w.value = associatedcolumn
             closestmatch_w.value = get_hoverable_html(closestmatch)
-            fix_w.value = None
-
-            if associatedcolumn == "-":
-                fix_w.options = [""]
-            elif associatedcolumn == "Scenario":
-                fix_w.options = ["", *self.model.VALID_SCENARIOS]
-            elif associatedcolumn == "Region":
-                fix_w.options = ["", *self.model.VALID_REGIONS]
-            elif associatedcolumn == "Variable":
-                fix_w.options = ["", *self.model.VALID_VARIABLES]
-            elif associatedcolumn == "Item":
-                fix_w.options = ["", *self.model.VALID_ITEMS]
-            elif associatedcolumn == "Unit":
-                fix_w.options = ["", *self.model.VALID_UNITS]
-            else:
+
+            if associatedcolumn not in fix_options:
                 raise Exception("Unexpected associated column")
 
-            fix_w.value = fix
+            if fix_w.options == fix_options[associatedcolumn]:  # Only value may need to be synced
+                fix_w.value = fix
+            else:
+                with fix_w.hold_sync():  # Send options & value to frontend in one message
+                    fix_w.value = None
+                    fix_w.options = fix_options[associatedcolumn]
+                    fix_w.value = fix
+
             override_w.value = override
 
-        # Assign required rows to table
-        self.unknown_labels_tbl.children = self._unknown_labels_tbl_cell_pool[: (nrowsneeded + 1) * 5]
+        # Assign header & required rows to table
+        self.unknown_labels_tbl.children = (
+            self._unknown_labels_tbl_header,
+            *self._unknown_labels_tbl_row_pool[:nrowsneeded],
+        )
+
+    def _grow_unknown_labels_tbl_row_pool(self, nrows):
+        """Add rows to unknown labels table's row pool until it has at least nrows rows."""
+        for row_index in range(len(self._unknown_labels_tbl_rows), nrows):
+            # Bind row index to Controller's onchange callbacks (ipywidgets passes change positionally)
+            dropdown = ui.Dropdown()
+            dropdown.observe(partial(self.ctrl.onchange_fix_dropdown, row_index=row_index), "value")
+            checkbox = ui.Checkbox(indent=False, value=False, description="")
+            checkbox.observe(partial(self.ctrl.onchange_override_checkbox, row_index=row_index), "value")
+            row_widgets = (ui.HTML(value="-"), ui.HTML(value="-"), ui.HTML(value="-"), dropdown, checkbox)
+            row = ui.HBox(children=[ui.Box(children=[widget]) for widget in row_widgets])
+            row.add_class(CSS.UNKNOWN_LABELS_TABLE__ROW)
+            self._unknown_labels_tbl_rows.append(row_widgets)
+            self._unknown_labels_tbl_row_pool.append(row)
 
     def update_plausibility_checking_page(self):
+        self._get_user_page(UserPage.PLAUSIBILITY_CHECKING - 1)
         # Update style & visibility of tab elements & content
         is_active = lambda tab: self.model.active_visualization_tab == tab
 
@@ -411,98 +618,115 @@ class View:
             self.growthtrends_tabelement.remove_class(CSS.VISUALIZATION_TAB__ELEMENT__ACTIVE)
             self.growthtrends_tabcontent.add_class(CSS.DISPLAY_MOD__NONE)
 
-        # Update dropdown options & values in the value trends tab
+        # Update dropdown options & values in the value trends tab (options are shared by both tabs)
+        scenario_options = tuple(sorted(self.model.uploaded_scenarios))
+        region_options = tuple(sorted(self.model.uploaded_regions))
+        variable_options = tuple(sorted(self.model.uploaded_variables))
         # - scenario dropdown
         set_dropdown_options(
-            self.valuetrends_scenario_ddown, self.model.uploaded_scenarios, self.ctrl.onchange_valuetrends_scenario
+            self.valuetrends_scenario_ddown,
+            scenario_options,
+            self.ctrl.onchange_valuetrends_scenario,
+            self.model.valuetrends_scenario,
         )
-        self.valuetrends_scenario_ddown.value = self.model.valuetrends_scenario
         # - region dropdown
         set_dropdown_options(
-            self.valuetrends_region_ddown, self.model.uploaded_regions, self.ctrl.onchange_valuetrends_region
+            self.valuetrends_region_ddown,
+            region_options,
+            self.ctrl.onchange_valuetrends_region,
+            self.model.valuetrends_region,
         )
-        self.valuetrends_region_ddown.value = self.model.valuetrends_region
         # - variable dropdown
         set_dropdown_options(
-            self.valuetrends_variable_ddown, self.model.uploaded_variables, self.ctrl.onchange_valuetrends_variable
+            self.valuetrends_variable_ddown,
+            variable_options,
+            self.ctrl.onchange_valuetrends_variable,
+            self.model.valuetrends_variable,
         )
-        self.valuetrends_variable_ddown.value = self.model.valuetrends_variable
         # Update dropdown options & values in growth trends tab
         # - scenario dropdown
         set_dropdown_options(
-            self.growthtrends_scenario_ddown, self.model.uploaded_scenarios, self.ctrl.onchange_growthtrends_scenario
+            self.growthtrends_scenario_ddown,
+            scenario_options,
+            self.ctrl.onchange_growthtrends_scenario,
+            self.model.growthtrends_scenario,
         )
-        self.growthtrends_scenario_ddown.value = self.model.growthtrends_scenario
         # - region dropdown
         set_dropdown_options(
-            self.growthtrends_region_ddown, self.model.uploaded_regions, self.ctrl.onchange_growthtrends_region
+            self.growthtrends_region_ddown,
+            region_options,
+            self.ctrl.onchange_growthtrends_region,
+            self.model.growthtrends_region,
         )
-        self.growthtrends_region_ddown.value = self.model.growthtrends_region
         # - variable dropdown
         set_dropdown_options(
-            self.growthtrends_variable_ddown, self.model.uploaded_variables, self.ctrl.onchange_growthtrends_variable
+            self.growthtrends_variable_ddown,
+            variable_options,
+            self.ctrl.onchange_growthtrends_variable,
+            self.model.growthtrends_variable,
         )
-        self.growthtrends_variable_ddown.value = self.model.growthtrends_variable
 
     def update_value_trends_chart(self):
         # TODO: Fix legends positioning problems
-
-        with self.valuetrends_viz_output:
-            clear_output(wait=True)
-            _, axes = plt.subplots(figsize=(PLOT_HEIGHT, PLOT_WIDTH))  # size in inches
-
-            if self.model.valuetrends_table is not None:
-                # Make sure we have enough colors for all lines
-                # https://stackoverflow.com/a/35971096/16133077
-                num_plots = self.model.valuetrends_table.ngroups
-                axes.set_prop_cycle(plt.cycler("color", plt.cm.jet(np.linspace(0, 1, num_plots))))  # type: ignore
-
-                # Multi-line chart
-                # https://stackoverflow.com/questions/29233283/plotting-multiple-lines-in-different-colors-with-pandas-dataframe?answertab=votes#tab-top
-                for key, group in self.model.valuetrends_table:
-                    axes = group.plot(
-                        ax=axes,
-                        kind="line",
-                        x=self.model.valuetrends_table_year_colname,
-                        y=self.model.valuetrends_table_value_colname,
-                        label=key,
-                    )
-
-            axes.set_xlabel("Year")
-            axes.set_ylabel("Value")
-            plt.title("Value Trends")
-            plt.grid()
-            plt.show()
+        self._get_user_page(UserPage.PLAUSIBILITY_CHECKING - 1)
+        self._update_trends_chart(
+            self.valuetrends_viz_output,
+            self._valuetrends_axes,
+            self._valuetrends_lines,
+            self.model.valuetrends_table,
+            self.model.valuetrends_table_year_colname,
+            self.model.valuetrends_table_value_colname,
+            ylabel="Value",
+            title="Value Trends",
+        )
 
     def update_growth_trends_chart(self):
         # TODO: Fix legends position problems
+        self._get_user_page(UserPage.PLAUSIBILITY_CHECKING - 1)
+        self._update_trends_chart(
+            self.growthtrends_viz_output,
+            self._growthtrends_axes,
+            self._growthtrends_lines,
+            self.model.growthtrends_table,
+            self.model.growthtrends_table_year_colname,
+            self.model.growthtrends_table_value_colname,
+            ylabel="Growth Value",
+            title="Growth Rate Trends",
+        )
+
+    def _update_trends_chart(self, output, axes, lines, table, year_colname, value_colname, ylabel, title):
+        """Redraw multi-line chart on its reused figure, existing lines are reused if the number of lines is same."""
+        groups = list(table) if table is not None else []
 
-        with self.growthtrends_viz_output:
+        if len(groups) == len(lines):
+            # Move existing lines to the new data
+            for line, (key, group) in zip(lines, groups):
+                line.set_data(group[year_colname], group[value_colname])
+                line.set_label(key)
+
+            axes.relim()
+            axes.autoscale_view()
+        else:
+            # Recreate lines
+            axes.cla()
+            lines.clear()
+            axes.set_prop_cycle(get_line_color_cycler(len(groups)))  # Make sure we have enough colors for all lines
+
+            # Multi-line chart
+            for key, group in groups:
+                lines += axes.plot(group[year_colname], group[value_colname], label=key)
+
+        if len(lines) > 0:
+            axes.legend()
+
+        axes.set_xlabel("Year")
+        axes.set_ylabel(ylabel)
+        axes.set_title(title)
+        axes.grid(True)
+
+        with output:
             clear_output(wait=True)
-            _, axes = plt.subplots(figsize=(PLOT_HEIGHT, PLOT_WIDTH))  # size in inches
-
-            if self.model.growthtrends_table is not None:
-                # Make sure we have enough colors for all lines
-                # https://stackoverflow.com/a/35971096/16133077
-                num_plots = self.model.growthtrends_table.ngroups
-                axes.set_prop_cycle(plt.cycler("color", plt.cm.jet(np.linspace(0, 1, num_plots))))  # type: ignore
-
-                # Multi-line chart
-                # https://stackoverflow.com/questions/29233283/plotting-multiple-lines-in-different-colors-with-pandas-dataframe?answertab=votes#tab-top
-                for key, group in self.model.growthtrends_table:
-                    axes = group.plot(
-                        ax=axes,
-                        kind="line",
-                        x=self.model.growthtrends_table_year_colname,
-                        y=self.model.growthtrends_table_value_colname,
-                        label=key,
-                    )
-
-            axes.set_xlabel("Year")
-            axes.set_ylabel("Growth Value")
-            plt.title("Growth Rate Trends")
-            plt.grid()
-            plt.show()
+            display(axes.figure)
 
     def _build_app(self):
         APP_TITLE = "AgMIP GlobalEcon Data Submission"
@@ -513,44 +737,36 @@ class View:
         self.notification.add_class(CSS.NOTIFICATION)
         # Create user mode widgets
         # - create stepper widget
-        PAGE_TITLES = ["File Upload", "Data Specification", "Integrity Checking", "Plausibility Checking"]
-        NUM_OF_PAGES = len(PAGE_TITLES)
         stepper_children = []
+        # - separator is static, so all stepper elements share one widget (ea parent renders its own view of it)
+        stepper_element_separator = ui.HTML(value="<hr width=48px/>")
+        stepper_element_separator.add_class(CSS.STEPPER_EL__SEPARATOR)
 
         for page_index in range(0, NUM_OF_PAGES):
             stepper_element_number = ui.HTML(value=str(page_index + 1))
             stepper_element_number.add_class(CSS.STEPPER_EL__NUMBER)
             stepper_element_title = ui.Label(value=PAGE_TITLES[page_index])
             stepper_element_title.add_class(CSS.STEPPER_EL__TITLE)
-            stepper_element_separator = ui.HTML(value="<hr width=48px/>")
-            stepper_element_separator.add_class(CSS.STEPPER_EL__SEPARATOR)
             stepper_element = (
-                ui.Box(children=[stepper_element_number, stepper_element_title])
+                ui.Box(children=(stepper_element_number, stepper_element_title))
                 if page_index == 0
-                else ui.Box(children=[stepper_element_separator, stepper_element_number, stepper_element_title])
+                else ui.Box(children=(stepper_element_separator, stepper_element_number, stepper_element_title))
             )
-            stepper_element.add_class(CSS.STEPPER_EL)
-            stepper_element.add_class(CSS.STEPPER_EL__CURRENT if page_index == 0 else CSS.STEPPER_EL__INACTIVE)
+            stepper_element._dom_classes = STEPPER_EL_CLASSES[page_index]
             stepper_children.append(stepper_element)
 
         self.user_page_stepper = ui.HBox(children=stepper_children)
 
         # - create user pages & user page container
+        #   -- only the first page is built now, other pages are built & added on first use (see _get_user_page)
+        self._user_pages = [self._build_file_upload_page()] + [None] * (NUM_OF_PAGES - 1)
         self.user_page_container = ui.Box(
-            children=[
-                self._build_file_upload_page(),
-                self._build_data_specification_page(),
-                self._build_integrity_checking_page(),
-                self._build_plausibility_checking_page(),
-            ],
+            children=(self._user_pages[0],),
             layout=ui.Layout(flex="1", width="100%"),  # page container stores the current page
         )
 
-        for page in self.user_page_container.children[1:]:  # hide all pages, except for the first one
-            page.add_class(CSS.DISPLAY_MOD__NONE)
-
-        # Create admin mode widgets
-        self.admin_page = self._build_admin_page()
+        # Admin mode widgets are created on first switch to admin mode
+        self.admin_page = None
         
         # Create app header
         self.user_mode_btn = ui.Button(description="User Mode")
@@ -558,22 +774,22 @@ class View:
         self.admin_mode_btn = ui.Button(description="Admin Mode")
         self.admin_mode_btn.on_click(self.ctrl.onclick_admin_mode_btn)
         self.app_title = ui.HTML(value=APP_TITLE)
-        self.app_header = ui.Box(children=[self.app_title, self.user_mode_btn])
+        self.app_header = ui.Box(children=(self.app_title, self.user_mode_btn))
         self.app_header.add_class(CSS.HEADER_BAR)
         
         # Create app body
         self.app_body = ui.VBox(  # vbox for app body
-            children=[self.user_page_stepper, self.user_page_container],  # - page stepper, page container
+            children=(self.user_page_stepper, self.user_page_container),  # - page stepper, page container
             layout=ui.Layout(flex="1", align_items="center", padding="36px 48px"),
         )
         
         # Create the app
         app = ui.VBox(  # vbox for app container
-            children=[
+            children=(
                 self.notification,  # - notification
                 self.app_header,  # - app header bar
                 self.app_body,  # - app body
-            ],
+            ),
         )
         app.add_class(CSS.APP)
         return app
@@ -592,10 +808,10 @@ class View:
         javascript_model.ua_file_label_model_id = self.ua_file_label.model_id
         # - create box representing the upload area component
         upload_area = ui.Box(  # box representing the upload area component
-            children=[
+            children=(
                 CSS.assign_class(
                     ui.HBox(  # - hbox for component's background widgets
-                        children=[
+                        children=(
                             ui.HTML(  # -- first half of upload instruction
                                 value=f"""<strong class="{CSS.COLOR_MOD__BLUE}"">&#128206;&nbsp;
                                 Add a CSV file&nbsp;</strong>"""
@@ -603,7 +819,7 @@ class View:
                             ui.HTML(  # -- second half of upload instruction
                                 value=f'<div class="{CSS.COLOR_MOD__GREY}"">from your computer</div>'
                             ),
-                        ]
+                        )
                     ),
                     CSS.UA__BACKGROUND,
                 ),
@@ -614,7 +830,7 @@ class View:
                     """
                 ),
                 self.ua_file_label,  # - hidden file label
-            ],
+            ),
             layout=ui.Layout(margin="20px 0px"),
         )
         
@@ -634,15 +850,14 @@ class View:
         x_button = ui.Button(icon="times")
         x_button.on_click(self.ctrl.onclick_remove_file)
         uploaded_file_snackbar = ui.Box(
-            children=[
+            children=(
                 uploaded_file_name,
                 x_button,
-            ],
+            ),
         )
-        uploaded_file_snackbar.add_class(CSS.FILENAME_SNACKBAR)
-        uploaded_file_snackbar.add_class(CSS.DISPLAY_MOD__NONE)
+        uploaded_file_snackbar._dom_classes = (CSS.FILENAME_SNACKBAR, CSS.DISPLAY_MOD__NONE)
         # - create box
-        self.uploaded_file_name_box = ui.Box(children=[no_file_uploaded, uploaded_file_snackbar])
+        self.uploaded_file_name_box = ui.Box(children=(no_file_uploaded, uploaded_file_snackbar))
         self.uploaded_file_name_box.layout = ui.Layout(margin="0px 0px 24px 0px")
         
         # Create project selection widget
@@ -653,16 +868,16 @@ class View:
         associatedprojects_select.add_class(CSS.ASSOCIATED_PROJECT_SELECT)
         
         # Create navigation button
-        next_button = ui.Button(description="Next", layout=ui.Layout(align_self="flex-end", justify_self="flex-end"))
+        next_button = ui.Button(description="Next", layout=NEXT_BUTTON_LAYOUT)
         next_button.on_click(self.ctrl.onclick_next_from_upage_1)
         
         # Create page
         return ui.VBox(  # vbox for page
-            children=[
+            children=(
                 ui.VBox(  # - vbox for page main components
-                    children=[
+                    children=(
                         ui.HBox(  # -- hbox for file upload instruction & info download button
-                            children=[
+                            children=(
                                 ui.HTML(  # --- file upload instruction
                                     value='<h4 style="margin: 0px;">1) Upload a data file</h4>'
                                 ),
@@ -679,7 +894,7 @@ class View:
                                     </a>
                                     """
                                 ),
-                            ],
+                            ),
                             layout=ui.Layout(width="500px", align_items="flex-end"),
                         ),
                         upload_area,  # -- upload area
@@ -688,12 +903,12 @@ class View:
                             value='<h4 style="margin: 0px;">2) Select associated projects</h4>'
                         ),
                         associatedprojects_select,  # -- project selection widget
-                    ],
+                    ),
                     layout=ui.Layout(flex="1", justify_content="center"),
                 ),
-                ui.HBox(children=[next_button], layout=ui.Layout(align_self="flex-end")),  # -navigation button box
-            ],
-            layout=ui.Layout(flex="1", width="100%", align_items="center", justify_content="center"),
+                ui.HBox(children=(next_button,), layout=ui.Layout(align_self="flex-end")),  # -navigation button box
+            ),
+            layout=USER_PAGE_LAYOUT,
         )
 
     def _build_data_specification_page(self):
@@ -731,39 +946,26 @@ class View:
         self.value_column_ddown = ui.Dropdown(value="", options=[""], layout=_control_layout)
         self.value_column_ddown.observe(self.ctrl.onchange_value_column_dropdown, "value")
         
-        # Create input data preview table TODO implement table w/ipywidgets HTML
-        self._input_data_table_childrenpool = [
-            ui.Box(children=[ui.Label(value="")]) for _ in range(33)  # Using 33 as cache size is random
-        ]
-        self.input_data_preview_tbl = ui.GridBox(
-            children=self._input_data_table_childrenpool[:24],  # 24 b/c assume table dim is 3 x 8 (row num constant, but col num varies)
-            layout=ui.Layout(grid_template_columns="repeat(8, 1fr)"),
-        )
+        # Create input & output data preview tables, static tables so ea is one HTML widget (see update method)
+        self.input_data_preview_tbl = ui.HTML(value="")
         self.input_data_preview_tbl.add_class(CSS.PREVIEW_TABLE)
-
-        # Create output data preview table TODO implement table w/ipywidgets HTML
-        self.output_data_preview_tbl = ui.GridBox(
-            children=[
-                ui.Box(children=[ui.Label(value="")]) for _ in range(24)
-            ],  # 24 b/c 3 x 8 table dim (invariant)
-            layout=ui.Layout(grid_template_columns="repeat(8, 1fr"),
-        )
+        self.output_data_preview_tbl = ui.HTML(value="")
         self.output_data_preview_tbl.add_class(CSS.PREVIEW_TABLE)
         
         # Create control widgets for page navigation
         previous = ui.Button(
             description="Previous",
-            layout=ui.Layout(align_self="flex-end", justify_self="flex-end", margin="0px 8px"),  # NOSONAR
+            layout=PREVIOUS_BUTTON_LAYOUT,  # NOSONAR
         )
         previous.on_click(self.ctrl.onclick_previous_from_upage_2)
-        next_ = ui.Button(description="Next", layout=ui.Layout(align_self="flex-end", justify_self="flex-end"))
+        next_ = ui.Button(description="Next", layout=NEXT_BUTTON_LAYOUT)
         next_.on_click(self.ctrl.onclick_next_from_upage_2)
         
         # Create input format spec section
         _label_layout = ui.Layout(width="205px")
         _wrapper_layout = ui.Layout(overflow_y="hidden")  # prevents scrollbar from appearing on safari
         input_format_specifications_section = ui.VBox(  # vbox for section
-            children=[
+            children=(
                 ui.GridBox(  # - gridbox for all format spec widgets except for "Scenarios to ignore"
                     children=(
                         ui.HBox(  # -- hbox for model name specs
@@ -798,7 +1000,7 @@ class View:
                     ),
                     layout=ui.Layout(margin="4px 0px 0px 0px"),
                 ),
-            ],
+            ),
             layout=ui.Layout(padding="8px 0px 16px 0px"),
         )
 
@@ -815,14 +1017,14 @@ class View:
                         CSS.assign_class(
                             ui.GridBox(  # -- col assign table
                                 children=(
-                                    ui.Box(children=(ui.Label(value="Model"),)),
-                                    ui.Box(children=(ui.Label(value="Scenario"),)),
-                                    ui.Box(children=(ui.Label(value="Region"),)),
-                                    ui.Box(children=(ui.Label(value="Variable"),)),
-                                    ui.Box(children=(ui.Label(value="Item"),)),
-                                    ui.Box(children=(ui.Label(value="Unit"),)),
-                                    ui.Box(children=(ui.Label(value="Year"),)),
-                                    ui.Box(children=(ui.Label(value="Value"),)),
+                                    get_table_cell("Model"),
+                                    get_table_cell("Scenario"),
+                                    get_table_cell("Region"),
+                                    get_table_cell("Variable"),
+                                    get_table_cell("Item"),
+                                    get_table_cell("Unit"),
+                                    get_table_cell("Year"),
+                                    get_table_cell("Value"),
                                     ui.Box(children=(self.model_name_lbl,)),
                                     self.scenario_column_ddown,
                                     self.region_column_ddown,
@@ -842,154 +1044,70 @@ class View:
                     ),
                     layout=ui.Layout(flex="1", width="900px", justify_content="center", align_items="flex-start"),
                 ),
-                ui.HBox(  # - hbox for the navigation buttons
-                    children=[previous, next_], layout=ui.Layout(justify_content="flex-end", width="100%")
-                ),
+                ui.HBox(children=(previous, next_), layout=NAVIGATION_BOX_LAYOUT),  # - hbox for the navigation buttons
             ),
-            layout=ui.Layout(flex="1", width="100%", align_items="center", justify_content="center"),
+            layout=USER_PAGE_LAYOUT,
         )
 
     def _build_integrity_checking_page(self):
         """Build the integrity checking page"""
         # Create control widgets
-        # - create row download buttons
+        # - create row download buttons, one per row of rows overview table
+        # - buttons are static links, so all of them are rendered by one HTML widget
         # - assume download paths constant else href values must be updated during page update
-        download_rows_field_issues_btn = ui.HTML(
-            value=f"""
-                <a
-                    href="{str(self.model.STRUCTISSUEFILE_PATH)}" 
-                    download="{str(self.model.STRUCTISSUEFILE_PATH.name)}"
-                    class="{CSS.ICON_BUTTON}"
-                    style="line-height:36px;"
-                    title=""
-                >
-                    <i class="fa fa-download" style="margin-left: 4px;"></i>
-                </a>
-            """
-        )
-        download_rows_w_ignored_scenario_btn = ui.HTML(
-            value=f"""
-                <a
-                    href="{str(self.model.IGNOREDSCENARIOFILE_PATH)}" 
-                    download="{str(self.model.IGNOREDSCENARIOFILE_PATH.name)}"
-                    class="{CSS.ICON_BUTTON}"
-                    style="line-height:36px;"
-                    title=""
-                >
-                    <i class="fa fa-download" style="margin-left: 4px;"></i>
-                </a>
-            """
-        )
-        download_duplicate_rows_btn = ui.HTML(
-            value=f"""
-                <a
-                    href="{str(self.model.DUPLICATESFILE_PATH)}" 
-                    download="{str(self.model.DUPLICATESFILE_PATH.name)}"
-                    class="{CSS.ICON_BUTTON}"
-                    style="line-height:36px;"
-                    title=""
-                >
-                    <i class="fa fa-download" style="margin-left: 4px;"></i>
-                </a>
-            """
+        download_paths = (
+            self.model.STRUCTISSUEFILE_PATH,
+            self.model.IGNOREDSCENARIOFILE_PATH,
+            self.model.DUPLICATESFILE_PATH,
+            self.model.ACCEPTEDFILE_PATH,
         )
-        download_accepted_rows = ui.HTML(
-            value=f"""
-                <a
-                    href="{str(self.model.ACCEPTEDFILE_PATH)}" 
-                    download="{str(self.model.ACCEPTEDFILE_PATH.name)}"
-                    class="{CSS.ICON_BUTTON}"
-                    style="line-height:36px;"
-                    title=""
-                >
-                    <i class="fa fa-download" style="margin-left: 4px;"></i>
-                </a>
-            """
+        download_rows_btns = ui.HTML(
+            value=(
+                f'<div class="{CSS.ROWS_OVERVIEW_DOWNLOAD_BUTTONS}">'
+                + "".join(get_download_button_html(path) for path in download_paths)
+                + "</div>"
+            )
         )
         # - create row summary labels
-        self.rows_w_struct_issues_lbl = ui.Label(value="0")
-        self.rows_w_ignored_scenario_lbl = ui.Label(value="0")
-        self.duplicate_rows_lbl = ui.Label(value="0")
-        self.accepted_rows_lbl = ui.Label(value="0")
+        self.rows_w_struct_issues_lbl = get_table_cell("0")
+        self.rows_w_ignored_scenario_lbl = get_table_cell("0")
+        self.duplicate_rows_lbl = get_table_cell("0")
+        self.accepted_rows_lbl = get_table_cell("0")
         # - create bad labels table
-        self.bad_labels_tbl = ui.HTML(
-            value=f"""
-            <table>
-                <thead>
-                    <th>Label</th>
-                    <th>Associated column</th>
-                    <th>Fix</th>
-                </thead>
-                <tbody>
-                    {''' 
-                    <tr>
-                        <td>-</td>
-                        <td>-</td>
-                        <td>-</td>
-                    <tr>
-                    ''' * 3 
-                    }
-                </tbody>
-            </table>
-            """
-        )
+        self.bad_labels_tbl = ui.HTML(value=BAD_LABELS_TABLE_INITIAL_HTML)
         self.bad_labels_tbl.add_class(CSS.BAD_LABELS_TABLE)
         # - create unknown labels table
         # - interactive table, so build process is different: create gridbox w/grey bg,pop w/boxes w/white bg makingit look like table 
+        # -- ea row is an HBox of boxes (one per cell), row HBoxes are hidden from CSS grid (display: contents)
+        #    so cells are laid out directly by the table's grid
         # -- create table's header row
-        self._unknown_labels_tbl_cell_pool = [
-            ui.Box(children=[ui.HTML(value="Label")]),
-            ui.Box(children=[ui.HTML(value="Associated column")]),
-            ui.Box(children=[ui.HTML(value="Closest Match")]),
-            ui.Box(children=[ui.HTML(value="Fix")]),
-            ui.Box(children=[ui.HTML(value="Override")]),
-        ]
-        # -- create table content row by row
-        #   -- ea row: [label, label, label, dropdown, checkbox] avoids
-        #   -- recreate ea cell widget at page update (slow, might cause memory leak in browser) 
-        #   -- create pool of cell widgets, assign as gridbox children
-        # TODO Create pool of rows instead of cells (more convenient)
-        
-        initial_nrows_in_pool = 10
-        ncolumns = 5
-
-        for row_index in range(initial_nrows_in_pool):
-            dropdown = ui.Dropdown()
-            # Create lambda to return onchange callback assigned to ipywidgets' dropdown
-            # Only have 1 onchange callback in Controller for all dropdowns in table
-            #  - requires dropdown row index as arg so onchange callback lambda returns calls 
-            #    Controller's onchange callback & passes right row index 
-            _get_dropdown_callback = lambda row_index_arg: lambda change: self.ctrl.onchange_fix_dropdown(
-                change, row_index_arg
-            )
-            
-            # Create lambda to return onchange callback assigned to ipywidgets' checkbox since lambda same as above 
-            _get_checkbox_callback = lambda row_index_arg: lambda change: self.ctrl.onchange_override_checkbox(
-                change, row_index_arg
+        self._unknown_labels_tbl_header = ui.HBox(
+            children=(
+                ui.Box(children=(ui.HTML(value="Label"),)),
+                ui.Box(children=(ui.HTML(value="Associated column"),)),
+                ui.Box(children=(ui.HTML(value="Closest Match"),)),
+                ui.Box(children=(ui.HTML(value="Fix"),)),
+                ui.Box(children=(ui.HTML(value="Override"),)),
             )
-            dropdown.observe(_get_dropdown_callback(row_index), "value")
-            checkbox = ui.Checkbox(indent=False, value=False, description="")
-            checkbox.observe(_get_checkbox_callback(row_index), "value")
-            self._unknown_labels_tbl_cell_pool += [
-                ui.Box(children=[ui.HTML(value="-")]),
-                ui.Box(children=[ui.HTML(value="-")]),
-                ui.Box(children=[ui.HTML(value="-")]),
-                ui.Box(children=[dropdown]),
-                ui.Box(children=[checkbox]),
-            ]
-
-        initial_nrows_in_table = 4
+        )
+        self._unknown_labels_tbl_header.add_class(CSS.UNKNOWN_LABELS_TABLE__ROW)
+        # -- create pool of content rows, rows are reused across page updates instead of recreated
+        #    (slow, might cause memory leak in browser) & pool only grows when more rows are needed
+        #   -- also keep unwrapped widgets of ea row, so page update can get row's widgets by row index
+        #   -- ea row: [label, label, label, dropdown, checkbox]
+        self._unknown_labels_tbl_rows = []
+        self._unknown_labels_tbl_row_pool = []
+        initial_nrows_in_table = 3
+        self._grow_unknown_labels_tbl_row_pool(initial_nrows_in_table)
         self.unknown_labels_tbl = ui.GridBox(
-            children=self._unknown_labels_tbl_cell_pool[: initial_nrows_in_table * ncolumns]
+            children=(self._unknown_labels_tbl_header, *self._unknown_labels_tbl_row_pool)
         )
         self.unknown_labels_tbl.add_class(CSS.UNKNOWN_LABELS_TABLE)
         
         # Create page nav buttons
-        next_ = ui.Button(description="Next", layout=ui.Layout(align_self="flex-end", justify_self="flex-end"))
+        next_ = ui.Button(description="Next", layout=NEXT_BUTTON_LAYOUT)
         next_.on_click(self.ctrl.onclick_next_from_upage_3)
-        previous = ui.Button(
-            description="Previous", layout=ui.Layout(align_self="flex-end", justify_self="flex-end", margin="0px 8px")
-        )
+        previous = ui.Button(description="Previous", layout=PREVIOUS_BUTTON_LAYOUT)
         previous.on_click(self.ctrl.onclick_previous_from_upage_3)
         
         # Create page
@@ -1008,46 +1126,27 @@ class View:
                             )
                         ),
                         ui.HBox(  # -- hbox for rows overview table & row download buttons
-                            children=[
+                            children=(
                                 CSS.assign_class(
                                     ui.GridBox(  # --- gridbox representing rows overview table
                                         # TODO table using ipywidgets HTML better since table not interactive?
                                         children=(
-                                            ui.Box(
-                                                children=(
-                                                    ui.Label(
-                                                        value=(
-                                                            "Number of rows with structural issues (missing"
-                                                            " fields, etc)"
-                                                        )
-                                                    ),
-                                                )
+                                            get_table_cell(
+                                                "Number of rows with structural issues (missing fields, etc)"
                                             ),
-                                            ui.Box(children=(self.rows_w_struct_issues_lbl,)),
-                                            ui.Box(
-                                                children=(
-                                                    ui.Label(value="Number of rows containing an ignored scenario"),
-                                                )
-                                            ),
-                                            ui.Box(children=(self.rows_w_ignored_scenario_lbl,)),
-                                            ui.HTML(value="Number of duplicate rows"),
-                                            ui.Box(children=(self.duplicate_rows_lbl,)),
-                                            ui.Box(children=(ui.Label(value="Number of accepted rows"),)),
-                                            ui.Box(children=(self.accepted_rows_lbl,)),
+                                            self.rows_w_struct_issues_lbl,
+                                            get_table_cell("Number of rows containing an ignored scenario"),
+                                            self.rows_w_ignored_scenario_lbl,
+                                            get_table_cell("Number of duplicate rows"),
+                                            self.duplicate_rows_lbl,
+                                            get_table_cell("Number of accepted rows"),
+                                            self.accepted_rows_lbl,
                                         ),
                                     ),
                                     CSS.ROWS_OVERVIEW_TABLE,
                                 ),
-                                ui.VBox(  # --- vbox for row download buttons
-                                    children=[
-                                        download_rows_field_issues_btn,
-                                        download_rows_w_ignored_scenario_btn,
-                                        download_duplicate_rows_btn,
-                                        download_accepted_rows,
-                                    ],
-                                    layout=ui.Layout(margin="16px 0px 20px 0px"),
-                                ),
-                            ]
+                                download_rows_btns,  # --- row download buttons
+                            )
                         ),
                         ui.HTML(  # --- bad labels overview title
                             value='<b style="line-height:13px; margin-bottom:4px;">Bad labels overview</b>'
@@ -1076,117 +1175,77 @@ class View:
                         flex="1", width="850px", justify_content="center", align_items="flex-start", align_self="center"
                     ),
                 ),
-                ui.HBox(  # - hbox for navigation buttons
-                    children=[previous, next_], layout=ui.Layout(justify_content="flex-end", width="100%")
-                ),
+                ui.HBox(children=(previous, next_), layout=NAVIGATION_BOX_LAYOUT),  # - hbox for navigation buttons
             ),
-            layout=ui.Layout(flex="1", width="100%", align_items="center", justify_content="center"),
+            layout=USER_PAGE_LAYOUT,
         )
 
     def _build_plausibility_checking_page(self):
+        # Create figures & line artists of trends charts, reused across chart updates
+        self._valuetrends_axes = Figure(figsize=(PLOT_HEIGHT, PLOT_WIDTH)).add_subplot(1, 1, 1)  # size in inches
+        self._valuetrends_lines = []
+        self._growthtrends_axes = Figure(figsize=(PLOT_HEIGHT, PLOT_WIDTH)).add_subplot(1, 1, 1)
+        self._growthtrends_lines = []
         # Create control widgets
         # - create control widgets for visualization tab bar
         value_tab_btn = ui.Button()
         value_tab_btn.on_click(self.ctrl.onclick_value_trends_tab)
         growth_tab_btn = ui.Button()
         growth_tab_btn.on_click(self.ctrl.onclick_growth_trends_tab)
-        self.valuetrends_tabelement = ui.Box(children=[ui.Label(value="Value trends"), value_tab_btn])
-        self.valuetrends_tabelement.add_class(CSS.VISUALIZATION_TAB__ELEMENT)
-        self.valuetrends_tabelement.add_class(CSS.VISUALIZATION_TAB__ELEMENT__ACTIVE)
-        self.growthtrends_tabelement = ui.Box(children=[ui.Label(value="Growth trends"), growth_tab_btn])
+        self.valuetrends_tabelement = ui.Box(children=(ui.Label(value="Value trends"), value_tab_btn))
+        self.valuetrends_tabelement._dom_classes = (
+            CSS.VISUALIZATION_TAB__ELEMENT,
+            CSS.VISUALIZATION_TAB__ELEMENT__ACTIVE,
+        )
+        self.growthtrends_tabelement = ui.Box(children=(ui.Label(value="Growth trends"), growth_tab_btn))
         self.growthtrends_tabelement.add_class(CSS.VISUALIZATION_TAB__ELEMENT)
         visualization_tabbar = ui.GridBox(
-            children=[
+            children=(
                 self.valuetrends_tabelement,
                 self.growthtrends_tabelement,
-            ]
+            )
         )
         visualization_tabbar.add_class(CSS.VISUALIZATION_TAB)
-        # - create shared layouts for dropdowns & output areas
-        _ddown_layout = ui.Layout(width="200px")
-        _viz_output_layout = ui.Layout(
-            margin="24px 0px 0px",
-            justify_content="center",
-            align_items="center",
-            height="360px",
-            width="100%",
-            overflow="auto",
-        )
-        # - create control widgets for value trends tab content
-        self.valuetrends_scenario_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_scenarios)
-        self.valuetrends_scenario_ddown.observe(self.ctrl.onchange_valuetrends_scenario, "value")
-        self.valuetrends_region_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_regions)
-        self.valuetrends_region_ddown.observe(self.ctrl.onchange_valuetrends_region, "value")
-        self.valuetrends_variable_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_variables)
-        self.valuetrends_variable_ddown.observe(self.ctrl.onchange_valuetrends_variable, "value")
-        visualize_value_btn = ui.Button(description="Visualize", layout=ui.Layout(margin="24px 0px 0px 0px"))  # NOSONAR
-        visualize_value_btn.on_click(self.ctrl.onclick_visualize_value_trends)
-        self.valuetrends_viz_output = ui.Output(layout=_viz_output_layout)
-        self.valuetrends_tabcontent = ui.VBox(
-            children=[
-                ui.GridBox(
-                    children=(
-                        ui.HTML(value="1. Scenario"),
-                        self.valuetrends_scenario_ddown,
-                        ui.HTML(value="2. Region"),
-                        self.valuetrends_region_ddown,
-                        ui.HTML(value="3. Variable"),
-                        self.valuetrends_variable_ddown,
-                    ),
-                    layout=ui.Layout(
-                        grid_template_columns="1fr 2fr 1fr 2fr 1fr 2fr", grid_gap="16px 16px", overflow_y="hidden"
-                    ),
-                ),
-                visualize_value_btn,
-                self.valuetrends_viz_output,
-            ],
-            layout=ui.Layout(align_items="center", padding="24px 0px 0px 0px", overflow_y="hidden"),
+        # - create value trends & growth trends tab contents, both tabs have the same structure
+        (
+            self.valuetrends_tabcontent,
+            self.valuetrends_scenario_ddown,
+            self.valuetrends_region_ddown,
+            self.valuetrends_variable_ddown,
+            self.valuetrends_viz_output,
+        ) = self._build_trends_tab_content(
+            self.ctrl.onchange_valuetrends_scenario,
+            self.ctrl.onchange_valuetrends_region,
+            self.ctrl.onchange_valuetrends_variable,
+            self.ctrl.onclick_visualize_value_trends,
         )
-        # - create control widgets for growth trends tab content
-        self.growthtrends_scenario_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_scenarios)
-        self.growthtrends_scenario_ddown.observe(self.ctrl.onchange_growthtrends_scenario, "value")
-        self.growthtrends_region_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_regions)
-        self.growthtrends_region_ddown.observe(self.ctrl.onchange_growthtrends_region, "value")
-        self.growthtrends_variable_ddown = ui.Dropdown(layout=_ddown_layout, options=self.model.uploaded_variables)
-        self.growthtrends_variable_ddown.observe(self.ctrl.onchange_growthtrends_variable, "value")
-        visualize_growth_btn = ui.Button(description="Visualize", layout=ui.Layout(margin="24px 0px 0px 0px"))
-        visualize_growth_btn.on_click(self.ctrl.onclick_visualize_growth_trends)
-        self.growthtrends_viz_output = ui.Output(layout=_viz_output_layout)
-        self.growthtrends_tabcontent = ui.VBox(
-            children=[
-                ui.GridBox(
-                    children=(
-                        ui.HTML(value="1. Scenario"),
-                        self.growthtrends_scenario_ddown,
-                        ui.HTML(value="2. Region"),
-                        self.growthtrends_region_ddown,
-                        ui.HTML(value="3. Variable"),
-                        self.growthtrends_variable_ddown,
-                    ),
-                    layout=ui.Layout(
-                        grid_template_columns="1fr 2fr 1fr 2fr 1fr 2fr", grid_gap="16px 16px", overflow_y="hidden"
-                    ),
-                ),
-                visualize_growth_btn,
-                self.growthtrends_viz_output,
-            ],
-            layout=ui.Layout(align_items="center", padding="24px 0px 0px 0px", overflow_y="hidden"),
+        (
+            self.growthtrends_tabcontent,
+            self.growthtrends_scenario_ddown,
+            self.growthtrends_region_ddown,
+            self.growthtrends_variable_ddown,
+            self.growthtrends_viz_output,
+        ) = self._build_trends_tab_content(
+            self.ctrl.onchange_growthtrends_scenario,
+            self.ctrl.onchange_growthtrends_region,
+            self.ctrl.onchange_growthtrends_variable,
+            self.ctrl.onclick_visualize_growth_trends,
         )
         self.growthtrends_tabcontent.add_class(CSS.DISPLAY_MOD__NONE)
         # - create control widgets for page navigation, submission, and download
         restart_submission = ui.Button(
-            icon="refresh", layout=ui.Layout(align_self="center", padding="0px 0px"), tooltip="Restart submission"
+            icon="refresh",
+            layout=ui.Layout(align_self="center", padding="0px 0px"),
+            tooltip="Restart submission",
+            _dom_classes=(CSS.ICON_BUTTON, CSS.ICON_BUTTON_MOD__RESTART_SUBMISSION),  # part of initial widget state
         )
-        restart_submission._dom_classes = (CSS.ICON_BUTTON, CSS.ICON_BUTTON_MOD__RESTART_SUBMISSION)
         restart_submission.on_click(self.ctrl.onclick_restart_submission)
-        previous = ui.Button(
-            description="Previous", layout=ui.Layout(align_self="flex-end", justify_self="flex-end", margin="0px 8px")
-        )
+        previous = ui.Button(description="Previous", layout=PREVIOUS_BUTTON_LAYOUT)
         previous.on_click(self.ctrl.onclick_previous_from_upage_4)
         submit = ui.Button(
             description="Submit",
             button_style="success",
-            layout=ui.Layout(align_self="flex-end", justify_self="flex-end"),
+            layout=NEXT_BUTTON_LAYOUT,
         )
         submit.on_click(self.ctrl.onclick_submit)
 
@@ -1196,9 +1255,9 @@ class View:
                 ui.VBox(  # - vbox for page main components
                     children=(
                         ui.HBox(  # -- hbox for [page title & instruction] & viz tab bar
-                            children=[
+                            children=(
                                 ui.VBox(  # --- vbox for page title & instruction
-                                    children=[
+                                    children=(
                                         ui.HTML(  # ---- page title
                                             value=(
                                                 '<b style="line-height:13px; margin-bottom:4px;">Plausibility'
@@ -1212,11 +1271,11 @@ class View:
                                                 " (Work-in-progress).</span>"
                                             )
                                         ),
-                                    ],
+                                    ),
                                     layout=ui.Layout(height="32px"),
                                 ),
                                 visualization_tabbar,  # --- visualization tab bar
-                            ],
+                            ),
                             layout=ui.Layout(align_items="center", justify_content="space-between", width="100%"),
                         ),
                         self.valuetrends_tabcontent,  # -- value trends tab content
@@ -1225,60 +1284,60 @@ class View:
                     layout=ui.Layout(width="900px", align_items="center", flex="1", justify_content="center"),
                 ),
                 ui.HBox(  # - hbox for navigation buttons
-                    children=[restart_submission, previous, submit],
-                    layout=ui.Layout(justify_content="flex-end", width="100%"),
+                    children=(restart_submission, previous, submit),
+                    layout=NAVIGATION_BOX_LAYOUT,
                 ),
             ),
-            layout=ui.Layout(flex="1", width="100%", align_items="center", justify_content="center"),
+            layout=USER_PAGE_LAYOUT,
         )
 
-    def _build_admin_page(self):
-        table_rows = ""
-
-        for row in self.model.get_submitted_files_info():
-            table_rows += "<tr>"
-
-            for colidx in range(len(row)):
-                field = row[colidx]
-                table_rows += f"<td>{field}</td>"
-            table_rows += "</tr>"
-
-        self.submissions_tbl = ui.HTML(
-            value=f"""
-            <table class="table">
-                <thead>
-                    <th style="width: 350px;">File</th>
-                    <th style="width: 200px;">Associated Project</th>
-                    <th style="width: 150px;">Status</th>
-                </thead>
-                <tbody>
-                    {table_rows}
-                    {''' 
-                    <tr>
-                        <td>-</td>
-                        <td>-</td>
-                        <td>-</td>
-                    <tr>
-                    ''' * (15 - len(table_rows))
-                    }
-                </tbody>
-            </table>
-        """
+    def _build_trends_tab_content(self, onchange_scenario, onchange_region, onchange_variable, onclick_visualize):
+        """Build content of a trends tab, return content box, scenario, region & variable dropdowns and chart output"""
+        # Create control widgets
+        # - options are left empty, update_plausibility_checking_page fills them in right after the page is built
+        scenario_ddown = ui.Dropdown(layout=TRENDS_TAB_DDOWN_LAYOUT)
+        scenario_ddown.observe(onchange_scenario, "value")
+        region_ddown = ui.Dropdown(layout=TRENDS_TAB_DDOWN_LAYOUT)
+        region_ddown.observe(onchange_region, "value")
+        variable_ddown = ui.Dropdown(layout=TRENDS_TAB_DDOWN_LAYOUT)
+        variable_ddown.observe(onchange_variable, "value")
+        visualize_btn = ui.Button(description="Visualize", layout=TRENDS_TAB_VISUALIZE_BUTTON_LAYOUT)
+        visualize_btn.on_click(onclick_visualize)
+        viz_output = ui.Output(layout=TRENDS_TAB_VIZ_OUTPUT_LAYOUT)
+
+        # Create tab content
+        tab_content = ui.VBox(
+            children=(
+                ui.GridBox(
+                    children=(
+                        ui.HTML(value="1. Scenario"),
+                        scenario_ddown,
+                        ui.HTML(value="2. Region"),
+                        region_ddown,
+                        ui.HTML(value="3. Variable"),
+                        variable_ddown,
+                    ),
+                    layout=TRENDS_TAB_GRID_LAYOUT,
+                ),
+                visualize_btn,
+                viz_output,
+            ),
+            layout=TRENDS_TAB_CONTENT_LAYOUT,
         )
+        return tab_content, scenario_ddown, region_ddown, variable_ddown, viz_output
+
+    def _build_admin_page(self):
+        # Table content is rendered by update_base_app, only when submissions changed
+        self.submissions_tbl = ui.HTML()
         return ui.VBox(  # vbox for page
-            children=[
+            children=(
                 ui.VBox(
-                    children=[
+                    children=(
                         ui.HTML(value='<h4 style="margin: 16px 0px;">Submission history</h4>'),  # - table title
                         self.submissions_tbl,
-                    ],
+                    ),
                     layout=ui.Layout(align_items="flex-start"),
-                )
-            ],
-            layout=ui.Layout(
-                flex="1",
-                width="100%",
-                align_items="center",
-                justify_content="center",
+                ),
             ),
+            layout=USER_PAGE_LAYOUT,
         )
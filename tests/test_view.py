@@ -0,0 +1,117 @@
+import threading
+from unittest.mock import patch
+
+import ipywidgets as ui
+import pytest
+
+from scripts import view as view_module
+from scripts.utils import CSS, Notification
+from scripts.view import View, debounce_page_update, set_dropdown_options
+
+
+WAIT_TIMEOUT = 5  # seconds, generous so loaded test runners don't fail at random
+
+
+class DebouncedView(View):
+    """View w/a debounced page update that records where it ran & notifications instead of showing them"""
+
+    def __init__(self):
+        super().__init__()
+        self.update_threads = []
+        self.updated = threading.Event()
+        self.notifications = []
+        self.notified = threading.Event()
+        self.update_error = None
+
+    @debounce_page_update
+    def request_page_update(self):
+        self.update_threads.append(threading.current_thread())
+        self.updated.set()
+
+        if self.update_error is not None:
+            raise self.update_error
+
+    def show_notification(self, variant, content):
+        self.notifications.append((variant, content))
+        self.notified.set()
+
+    def pending_timer(self) -> threading.Timer:
+        return self._page_update_timers["request_page_update"]
+
+
+@pytest.fixture
+def view(monkeypatch) -> DebouncedView:
+    monkeypatch.setattr("scripts.model.Model", lambda: None)  # Model needs a running notebook server
+    monkeypatch.setattr(view_module, "PAGE_UPDATE_DELAY", 0.05)
+    return DebouncedView()
+
+
+def test_burst_of_requests_updates_page_once(view: DebouncedView):
+    timers = []
+    for _ in range(5):
+        view.request_page_update()
+        timers.append(view.pending_timer())
+    assert view.updated.wait(WAIT_TIMEOUT)
+    for timer in timers:
+        timer.join(WAIT_TIMEOUT)
+    assert view.update_threads == [timers[-1]]
+
+
+def test_flush_runs_pending_update_on_calling_thread(view: DebouncedView):
+    view.request_page_update()
+    timer = view.pending_timer()
+    view.flush()
+    assert view.update_threads == [threading.current_thread()]
+    timer.join(WAIT_TIMEOUT)  # Flushed update must not run again in its timer thread
+    assert view.update_threads == [threading.current_thread()]
+    view.flush()  # Nothing pending
+    assert len(view.update_threads) == 1
+
+
+def test_flush_raises_update_error(view: DebouncedView):
+    view.update_error = Exception("Unexpected associated column")
+    view.request_page_update()
+    with pytest.raises(Exception, match="Unexpected associated column"):
+        view.flush()
+
+
+def test_debounced_update_error_is_shown_to_user(view: DebouncedView):
+    view.update_error = Exception("Unexpected associated column")
+    view.request_page_update()
+    assert view.notified.wait(WAIT_TIMEOUT)
+    assert view.notifications == [(Notification.ERROR, "Unexpected associated column")]
+
+
+def test_set_dropdown_options_writes_only_value_when_options_unchanged():
+    dropdown = ui.Dropdown(options=("", "a", "b"), value="a")
+    options_changes, callback_changes = [], []
+    dropdown.observe(options_changes.append, "options")
+    dropdown.observe(callback_changes.append, "value")
+    set_dropdown_options(dropdown, ("", "a", "b"), callback_changes.append, "b")
+    assert dropdown.value == "b"
+    assert options_changes == []
+    assert len(callback_changes) == 1  # Callback stays observed, model's value is treated as no change by Controller
+
+
+def test_set_dropdown_options_sends_changed_options_and_value_while_unobserved():
+    dropdown = ui.Dropdown(options=("", "a"), value="a")
+    callback_changes = []
+    dropdown.observe(callback_changes.append, "value")
+    with patch.object(dropdown, "_send", wraps=dropdown._send) as send:
+        set_dropdown_options(dropdown, ("", "b", "c"), callback_changes.append, "c")
+    assert dropdown.options == ("", "b", "c")
+    assert dropdown.value == "c"
+    assert callback_changes == []
+    assert send.call_count == 1  # One message w/options & value
+    assert send.call_args.args[0]["state"] == {"_options_labels": ("", "b", "c"), "index": 2}
+    dropdown.value = "b"  # Callback is observed again
+    assert len(callback_changes) == 1
+
+
+def test_unknown_notification_variant_leaves_notification_unchanged(view: DebouncedView):
+    view.notification = ui.HBox(children=(ui.HTML(), ui.HTML(value="old")))
+    view.notification._dom_classes = (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__INFO)
+    with pytest.raises(Exception, match="Notification variant does not exist"):
+        View.show_notification(view, "unknown", "new")
+    assert view.notification._dom_classes == (CSS.NOTIFICATION, CSS.NOTIFICATION__SHOW, CSS.NOTIFICATION__INFO)
+    assert view.notification.children[1].value == "old"